@@ -3,17 +3,14 @@ from __future__ import annotations
 import argparse
 
 from . import __version__
-from .expand import expand
-from .render import render_to_png
-from .turtle import interpret
-from .types import Grammar
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="lsysviz")
     parser.add_argument(
         "--version",
-        action="store_true",
+        action="version",
+        version=__version__,
         help="Print version information and exit.",
     )
 
@@ -87,9 +84,12 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    if args.version:
-        print(__version__)
-        return 0
+    # Import the pipeline only once there is work to do, so --help and
+    # --version (which exit inside parse_args) don't pay for it.
+    from .expand import expand
+    from .render import render_to_png
+    from .turtle import interpret
+    from .types import Grammar
 
     rules = _parse_rules(args.rule)
     grammar = Grammar(axiom=args.axiom, rules=rules)
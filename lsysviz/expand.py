@@ -1,26 +1,86 @@
 from __future__ import annotations
 
+from typing import Iterator
+
 from .types import Grammar
 
 
 def expand(grammar: Grammar, iterations: int) -> str:
     """Expand an L-system grammar for a given number of iterations.
 
-    Rules are applied simultaneously per iteration by scanning the current
-    string left-to-right and replacing each character if it exists as a key in
-    grammar.rules; otherwise the character is kept unchanged.
+    Rules are applied simultaneously per iteration: every character that
+    exists as a key in grammar.rules is replaced; otherwise the character is
+    kept unchanged.
+
+    Because rewriting is context-free, each symbol expands the same way
+    wherever it occurs. Once the string starts growing, the expansion of
+    every symbol is therefore built once per remaining depth, bottom-up, and
+    the result is assembled by joining those images, so all per-character
+    work happens in C string copies. Until then (e.g. for grammars that only
+    permute, erase or keep symbols) the string is rewritten directly, which
+    keeps memory flat however large iterations is.
 
     This function is pure and deterministic.
     """
     if iterations < 0:
         raise ValueError("iterations must be >= 0")
 
-    current = grammar.axiom
-    if iterations == 0:
-        return current
-
     rules = grammar.rules
+    lookup = rules.get
+    lstring = grammar.axiom
+    while True:
+        if iterations == 0 or rules.keys().isdisjoint(lstring):
+            # Nothing left to rewrite: the string is already final.
+            return lstring
+        rewritten = "".join(map(lookup, lstring, lstring))
+        iterations -= 1
+        if rewritten == lstring:
+            # A fixed point stays fixed for the remaining iterations.
+            return lstring
+        grew = len(rewritten) > len(lstring)
+        lstring = rewritten
+        if grew:
+            break
+
+    # levels[d] holds the symbols that occur after d more rewrites. Once no
+    # rule applies, every deeper image is the identity, so stop there.
+    levels = [set(lstring)]
     for _ in range(iterations):
-        current = "".join(rules.get(ch, ch) for ch in current)
+        if rules.keys().isdisjoint(levels[-1]):
+            break
+        levels.append({out for ch in levels[-1] for out in rules.get(ch, ch)})
+
+    # images[ch] is the expansion of ch over the remaining depth; at the
+    # deepest level every symbol is final.
+    images = {ch: ch for ch in levels.pop()}
+    for symbols in reversed(levels):
+        image_of = images.__getitem__
+        images = {ch: "".join(map(image_of, rules[ch])) if ch in rules else ch for ch in symbols}
+
+    return "".join(map(images.__getitem__, lstring))
+
+
+def expand_stream(grammar: Grammar, iterations: int) -> Iterator[str]:
+    """Lazily yield the characters of ``expand(grammar, iterations)``.
+
+    The rewrite tree is walked depth-first with an explicit stack of
+    iterators, one per rewrite level, so memory stays proportional to
+    iterations instead of to the (exponentially long) expanded string.
+    """
+    if iterations < 0:
+        raise ValueError("iterations must be >= 0")
+
+    return _walk(grammar.axiom, grammar.rules, iterations)
+
 
-    return current
+def _walk(axiom: str, rules: dict[str, str], iterations: int) -> Iterator[str]:
+    stack = [iter(axiom)]
+    while stack:
+        for ch in stack[-1]:
+            # A character at stack depth d has been rewritten d - 1 times.
+            if len(stack) <= iterations and ch in rules:
+                stack.append(iter(rules[ch]))
+                break
+            yield ch
+        else:
+            stack.pop()
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 import math
-from typing import List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from .types import Segment
 
 
-def interpret(lstring: str, angle_deg: float, step_length: float) -> list[Segment]:
+def interpret(lstring: Iterable[str], angle_deg: float, step_length: float) -> list[Segment]:
     """Interpret an L-system string using turtle-graphics rules.
 
     The turtle starts at (0.0, 0.0) with heading 90 degrees (up).
@@ -18,34 +18,51 @@ def interpret(lstring: str, angle_deg: float, step_length: float) -> list[Segmen
       - '[': push current (x, y, heading_deg) onto a stack
       - ']': pop (x, y, heading_deg) from the stack
 
-    All other characters are ignored.
+    All other characters are ignored. lstring may be any iterable of
+    characters, e.g. the lazy output of expand_stream().
 
     This function is pure and deterministic.
     """
 
     x: float = 0.0
     y: float = 0.0
-    heading_deg: float = 90.0
+    # The heading is always 90 + turns * angle_deg degrees, so it is tracked
+    # as an integer turn count and each distinct heading's step vector is
+    # computed once instead of calling cos/sin for every 'F'.
+    turns: int = 0
+    steps: Dict[int, Tuple[float, float]] = {}
 
     segments: List[Segment] = []
-    stack: List[Tuple[float, float, float]] = []
+    stack: List[Tuple[float, float, int]] = []
+
+    # Bind hot attribute lookups to locals once instead of per symbol, and
+    # build segments via tuple.__new__ to skip NamedTuple's Python-level
+    # __new__ frame (the same shortcut Segment._make uses internally).
+    new_tuple = tuple.__new__
+    emit = segments.append
+    push = stack.append
+    pop = stack.pop
 
     for ch in lstring:
         if ch == "F":
-            theta = math.radians(heading_deg)
-            x1 = x + step_length * math.cos(theta)
-            y1 = y + step_length * math.sin(theta)
-            segments.append(Segment(x, y, x1, y1))
+            try:
+                dx, dy = steps[turns]
+            except KeyError:
+                theta = math.radians(90.0 + turns * angle_deg)
+                dx, dy = steps[turns] = (step_length * math.cos(theta), step_length * math.sin(theta))
+            x1 = x + dx
+            y1 = y + dy
+            emit(new_tuple(Segment, (x, y, x1, y1)))
             x, y = x1, y1
         elif ch == "+":
-            heading_deg += angle_deg
+            turns += 1
         elif ch == "-":
-            heading_deg -= angle_deg
+            turns -= 1
         elif ch == "[":
-            stack.append((x, y, heading_deg))
+            push((x, y, turns))
         elif ch == "]":
             if stack:
-                x, y, heading_deg = stack.pop()
+                x, y, turns = pop()
         else:
             # Ignore all other characters
             continue
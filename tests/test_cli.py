@@ -0,0 +1,29 @@
+import pytest
+
+from lsysviz import __version__
+from lsysviz.cli import main
+
+
+def test_version_exits_without_required_arguments(capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        main(["--version"])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out.strip() == __version__
+
+
+def test_main_renders_png(tmp_path) -> None:
+    out_path = tmp_path / "plant.png"
+    rc = main(
+        [
+            "--axiom", "F",
+            "--rule", "F=F[+F]F",
+            "--iterations", "2",
+            "--angle", "25",
+            "--step", "5",
+            "--output", str(out_path),
+            "--width", "64",
+            "--height", "48",
+        ]
+    )
+    assert rc == 0
+    assert out_path.read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
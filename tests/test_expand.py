@@ -1,6 +1,8 @@
+import tracemalloc
+
 import pytest
 
-from lsysviz.expand import expand
+from lsysviz.expand import expand, expand_stream
 from lsysviz.types import Grammar
 
 
@@ -30,3 +32,61 @@ def test_expand_preserves_characters_not_in_rules():
 def test_expand_empty_rules_leaves_axiom_unchanged():
     g = Grammar(axiom="F+F", rules={})
     assert expand(g, 5) == "F+F"
+
+
+def test_expand_ignores_multi_character_rule_keys():
+    g = Grammar(axiom="FX", rules={"FX": "Y", "F": "FF"})
+    assert expand(g, 1) == "FFX"
+
+
+@pytest.mark.parametrize(
+    "axiom, rules, expected",
+    [
+        ("AB", {"A": "B", "B": "A"}, "BA"),
+        ("F+F", {"F": "F"}, "F+F"),
+        ("AFA", {"A": ""}, "F"),
+    ],
+)
+def test_expand_non_growing_grammar_with_many_iterations(axiom, rules, expected):
+    # Non-growing strings must not cost memory per iteration.
+    tracemalloc.start()
+    try:
+        result = expand(Grammar(axiom=axiom, rules=rules), 20_001)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert result == expected
+    assert peak < 1_000_000
+
+
+@pytest.mark.parametrize("iterations", [0, 1, 2, 5])
+def test_expand_stream_matches_expand(iterations):
+    g = Grammar(axiom="X", rules={"X": "F+[[X]-X]-F[-FX]+X", "F": "FF", "Z": ""})
+    assert "".join(expand_stream(g, iterations)) == expand(g, iterations)
+
+
+def test_expand_stream_handles_empty_replacement():
+    g = Grammar(axiom="AB", rules={"A": "", "B": "AB"})
+    assert "".join(expand_stream(g, 3)) == expand(g, 3) == "AB"
+
+
+def test_expand_stream_rejects_negative_iterations():
+    with pytest.raises(ValueError):
+        expand_stream(Grammar(axiom="F", rules={}), -1)
+
+
+@pytest.mark.parametrize(
+    "axiom, rules, iterations",
+    [
+        ("X", {"X": "F+[[X]-X]-F[-FX]+X", "F": "FF"}, 4),
+        ("F-G-G", {"F": "F-G+F+G-F", "G": "GG"}, 3),
+        ("AQ", {"A": "B", "B": "AC", "C": "", "Q": "QQ"}, 6),
+        ("F", {"F": "F+"}, 7),
+        ("A", {"A": "B", "B": "C", "C": "CD", "D": "A"}, 8),
+    ],
+)
+def test_expand_matches_naive_rewriting(axiom, rules, iterations):
+    expected = axiom
+    for _ in range(iterations):
+        expected = "".join(rules.get(ch, ch) for ch in expected)
+    assert expand(Grammar(axiom=axiom, rules=rules), iterations) == expected
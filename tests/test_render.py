@@ -1,40 +1,47 @@
-import os
-import tempfile
-
 import pytest
 
-from lsysviz.render import render_to_png
-from lsysviz.types import Segment
+from lsysviz.expand import expand
+from lsysviz.render import (
+    _chain_polylines,
+    _draw_line_bresenham,
+    _map_segments_to_image,
+    _new_white_pixels,
+    render_to_png,
+)
+from lsysviz.turtle import interpret
+from lsysviz.types import Grammar, Segment
 
 
 PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
 
 
-def _read_bytes(path: str) -> bytes:
-    with open(path, "rb") as f:
-        return f.read()
+def _black_pixels(pixels: bytearray, width: int) -> set[tuple[int, int]]:
+    black = set()
+    for i in range(0, len(pixels), 3):
+        if pixels[i : i + 3] == b"\x00\x00\x00":
+            y, x = divmod(i // 3, width)
+            black.add((x, y))
+    return black
 
 
-def test_render_non_empty_creates_valid_png() -> None:
-    out_dir = tempfile.mkdtemp()
-    out_path = os.path.join(out_dir, "non_empty.png")
+def test_render_non_empty_creates_valid_png(tmp_path) -> None:
+    out_path = tmp_path / "non_empty.png"
 
     segments = [Segment(0.0, 0.0, 10.0, 10.0), Segment(10.0, 0.0, 0.0, 10.0)]
-    render_to_png(segments=segments, width=64, height=64, output_path=out_path)
+    render_to_png(segments=segments, width=64, height=64, output_path=str(out_path))
 
-    assert os.path.exists(out_path)
-    data = _read_bytes(out_path)
+    assert out_path.exists()
+    data = out_path.read_bytes()
     assert data.startswith(PNG_MAGIC)
 
 
-def test_render_empty_creates_file_blank_white_image() -> None:
-    out_dir = tempfile.mkdtemp()
-    out_path = os.path.join(out_dir, "empty.png")
+def test_render_empty_creates_file_blank_white_image(tmp_path) -> None:
+    out_path = tmp_path / "empty.png"
 
-    render_to_png(segments=[], width=32, height=16, output_path=out_path)
+    render_to_png(segments=[], width=32, height=16, output_path=str(out_path))
 
-    assert os.path.exists(out_path)
-    data = _read_bytes(out_path)
+    assert out_path.exists()
+    data = out_path.read_bytes()
     assert data.startswith(PNG_MAGIC)
 
     # If Pillow is available, verify dimensions.
@@ -47,10 +54,9 @@ def test_render_empty_creates_file_blank_white_image() -> None:
         pass
 
 
-def test_render_determinism_byte_identical_outputs() -> None:
-    out_dir = tempfile.mkdtemp()
-    out_path1 = os.path.join(out_dir, "det1.png")
-    out_path2 = os.path.join(out_dir, "det2.png")
+def test_render_determinism_byte_identical_outputs(tmp_path) -> None:
+    out_path1 = tmp_path / "det1.png"
+    out_path2 = tmp_path / "det2.png"
 
     segments = [
         Segment(0.0, 0.0, 10.0, 0.0),
@@ -59,17 +65,16 @@ def test_render_determinism_byte_identical_outputs() -> None:
         Segment(0.0, 10.0, 0.0, 0.0),
     ]
 
-    render_to_png(segments=segments, width=80, height=60, output_path=out_path1)
-    render_to_png(segments=segments, width=80, height=60, output_path=out_path2)
+    render_to_png(segments=segments, width=80, height=60, output_path=str(out_path1))
+    render_to_png(segments=segments, width=80, height=60, output_path=str(out_path2))
 
-    b1 = _read_bytes(out_path1)
-    b2 = _read_bytes(out_path2)
+    b1 = out_path1.read_bytes()
+    b2 = out_path2.read_bytes()
     assert b1 == b2
 
 
-def test_render_negative_coordinates_no_error() -> None:
-    out_dir = tempfile.mkdtemp()
-    out_path = os.path.join(out_dir, "negative_coords.png")
+def test_render_negative_coordinates_no_error(tmp_path) -> None:
+    out_path = tmp_path / "negative_coords.png"
 
     segments = [
         Segment(-10.0, -10.0, -5.0, -5.0),
@@ -77,8 +82,79 @@ def test_render_negative_coordinates_no_error() -> None:
     ]
 
     # Should not raise; renderer must map arbitrary coordinate ranges.
-    render_to_png(segments=segments, width=64, height=64, output_path=out_path)
+    render_to_png(segments=segments, width=64, height=64, output_path=str(out_path))
 
-    assert os.path.exists(out_path)
-    data = _read_bytes(out_path)
+    assert out_path.exists()
+    data = out_path.read_bytes()
     assert data.startswith(PNG_MAGIC)
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (2, 2), (3, 1)])
+def test_map_segments_clamps_to_tiny_canvas(width, height) -> None:
+    segments = [Segment(0.0, 0.0, 1.0, 1.0), Segment(1.0, 1.0, -2.0, 3.0)]
+    for x0, y0, x1, y1 in _map_segments_to_image(segments, width, height):
+        assert 0 <= x0 < width and 0 <= x1 < width
+        assert 0 <= y0 < height and 0 <= y1 < height
+
+
+def test_chain_polylines_splits_on_discontinuity() -> None:
+    mapped = [(0, 0, 1, 1), (1, 1, 2, 2), (5, 5, 6, 6), (6, 6, 7, 5)]
+    assert _chain_polylines(mapped) == [[0, 0, 1, 1, 2, 2], [5, 5, 6, 6, 7, 5]]
+
+
+def test_chained_polylines_draw_same_pixels_as_single_segments() -> None:
+    Image = pytest.importorskip("PIL.Image")
+    ImageDraw = pytest.importorskip("PIL.ImageDraw")
+
+    grammar = Grammar(axiom="X", rules={"X": "F+[[X]-X]-F[-FX]+X", "F": "FF"})
+    segments = interpret(expand(grammar, 4), angle_deg=25.0, step_length=5.0)
+    mapped = _map_segments_to_image(segments, 200, 150)
+    polylines = _chain_polylines(mapped)
+    assert 1 < len(polylines) < len(mapped)
+
+    per_segment = Image.new("RGB", (200, 150), (255, 255, 255))
+    draw = ImageDraw.Draw(per_segment)
+    for seg in mapped:
+        draw.line(seg, fill=(0, 0, 0), width=1)
+
+    chained = Image.new("RGB", (200, 150), (255, 255, 255))
+    draw = ImageDraw.Draw(chained)
+    for polyline in polylines:
+        draw.line(polyline, fill=(0, 0, 0), width=1)
+
+    assert chained.tobytes() == per_segment.tobytes()
+
+
+def test_bresenham_clips_off_canvas_endpoints() -> None:
+    clipped = _new_white_pixels(4, 3)
+    _draw_line_bresenham(clipped, 4, 3, -2, 1, 5, 1)
+    on_canvas = _new_white_pixels(4, 3)
+    _draw_line_bresenham(on_canvas, 4, 3, 0, 1, 3, 1)
+    assert clipped == on_canvas
+    assert on_canvas[12:24] == b"\x00" * 12
+
+
+def test_bresenham_horizontal_run_is_direction_independent() -> None:
+    forward = _new_white_pixels(5, 2)
+    _draw_line_bresenham(forward, 5, 2, 1, 1, 4, 1)
+    backward = _new_white_pixels(5, 2)
+    _draw_line_bresenham(backward, 5, 2, 4, 1, 1, 1)
+    assert forward == backward
+    assert forward == b"\xff" * 18 + b"\x00" * 12
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ((0, 0, 4, 4), {(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)}),
+        ((4, 4, 0, 0), {(0, 0), (1, 1), (2, 2), (3, 3), (4, 4)}),
+        ((3, 0, 0, 3), {(3, 0), (2, 1), (1, 2), (0, 3)}),
+        ((0, 3, 3, 0), {(3, 0), (2, 1), (1, 2), (0, 3)}),
+        ((2, 0, 2, 4), {(2, 0), (2, 1), (2, 2), (2, 3), (2, 4)}),
+        ((2, 4, 2, 0), {(2, 0), (2, 1), (2, 2), (2, 3), (2, 4)}),
+    ],
+)
+def test_bresenham_on_canvas_lines_plot_exact_pixels(line, expected) -> None:
+    pixels = _new_white_pixels(5, 5)
+    _draw_line_bresenham(pixels, 5, 5, *line)
+    assert _black_pixels(pixels, 5) == expected